@@ -83,6 +83,8 @@ DATABASES = {
     },
     "inventory": {
         "ENGINE": "django.db.backends.mysql",
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
         "HOST": DOLT_HOST,
         "PORT": DOLT_PORT,
         "USER": DOLT_USER,
@@ -91,6 +93,8 @@ DATABASES = {
     },
     "orders": {
         "ENGINE": "django.db.backends.mysql",
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
         "HOST": DOLT_HOST,
         "PORT": DOLT_PORT,
         "USER": DOLT_USER,
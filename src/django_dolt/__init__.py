@@ -18,13 +18,20 @@ from django_dolt.services import (
     dolt_current_branch,
     dolt_diff,
     dolt_fetch,
+    dolt_fetch_async,
     dolt_log,
     dolt_pull,
+    dolt_pull_async,
     dolt_push,
+    dolt_push_async,
+    dolt_push_many,
     dolt_remotes,
     dolt_status,
     format_status_rows,
     get_ignored_tables,
+    invalidate_caches,
+    iter_dolt_diff,
+    iter_dolt_log,
 )
 
 __version__ = "1.1.0"
@@ -44,10 +51,17 @@ __all__ = [
     "dolt_add_and_commit",
     "dolt_status",
     "dolt_log",
+    "iter_dolt_log",
     "dolt_diff",
+    "iter_dolt_diff",
     "dolt_pull",
     "dolt_push",
+    "dolt_push_many",
     "dolt_fetch",
+    # Async network operations
+    "dolt_push_async",
+    "dolt_pull_async",
+    "dolt_fetch_async",
     # Branch operations
     "dolt_branch_list",
     "dolt_current_branch",
@@ -57,32 +71,46 @@ __all__ = [
     # Utilities
     "get_ignored_tables",
     "format_status_rows",
+    "invalidate_caches",
     "get_dolt_databases",
     # View decorator
     "dolt_autocommit",
     "get_author_from_request",
     # Admin extension
     "register_branch_extension",
+    "get_request_branch",
     "DoltCommitMixin",
 ]
 
 
 def __getattr__(name: str) -> Any:
-    """Lazy import for models and admin classes to avoid AppRegistryNotReady errors."""
+    """Lazy import for models and admin classes to avoid AppRegistryNotReady errors.
+
+    Resolved values are stored in the module namespace, so later accesses
+    are plain attribute lookups and never reach this function again.
+    """
+    value: Any
     if name in ("Branch", "Commit", "Remote"):
         from django.apps import apps
 
-        return apps.get_model("django_dolt", name)
-    if name == "get_dolt_databases":
+        value = apps.get_model("django_dolt", name)
+    elif name == "get_dolt_databases":
         from django_dolt.dolt_databases import get_dolt_databases
 
-        return get_dolt_databases
-    if name == "register_branch_extension":
+        value = get_dolt_databases
+    elif name == "register_branch_extension":
         from django_dolt.admin import register_branch_extension
 
-        return register_branch_extension
-    if name == "DoltCommitMixin":
+        value = register_branch_extension
+    elif name == "get_request_branch":
+        from django_dolt.admin import get_request_branch
+
+        value = get_request_branch
+    elif name == "DoltCommitMixin":
         from django_dolt.admin import DoltCommitMixin
 
-        return DoltCommitMixin
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = DoltCommitMixin
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
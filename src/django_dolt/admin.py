@@ -6,19 +6,27 @@ plus read-only ModelAdmin classes for Dolt system tables.
 """
 
 from typing import Any, cast
+from urllib.parse import quote
 
 from django.contrib import admin, messages
+from django.contrib.admin.views.main import ChangeList
 from django.core.exceptions import PermissionDenied
 from django.db import router
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 from django.template.response import TemplateResponse
 from django.urls import URLPattern, path, reverse
+from django.utils.http import RFC3986_SUBDELIMS
 
 from django_dolt import services
 from django_dolt.decorators import get_author_from_request
-from django_dolt.dolt_databases import get_dolt_databases
+from django_dolt.dolt_databases import get_db_display_name, get_dolt_databases
 from django_dolt.models import Branch, Commit
 
+# Characters of a commit hash shown in list views and messages
+_HASH_LEN = 8
+# Characters of a commit message shown before truncating with "..."
+_MESSAGE_PREVIEW_LEN = 60
+
 
 def _get_dolt_db_for_model(model: type) -> str | None:
     """Get the Dolt database alias for a model using Django's router."""
@@ -28,6 +36,18 @@ def _get_dolt_db_for_model(model: type) -> str | None:
     return None
 
 
+def get_request_branch(request: HttpRequest, db_alias: str) -> str:
+    """Return the active branch of ``db_alias``, looked up once per request.
+
+    The result is cached on the request so the status view and branch
+    extensions rendering the same request share a single query.
+    """
+    branches: dict[str, str] = request.__dict__.setdefault("_dolt_branches", {})
+    if db_alias not in branches:
+        branches[db_alias] = services.dolt_current_branch(using=db_alias)
+    return branches[db_alias]
+
+
 class DoltCommitMixin:
     """ModelAdmin mixin that adds a 'Save and commit' button to change forms.
 
@@ -60,7 +80,9 @@ class DoltCommitMixin:
                 using=db_alias,
             )
             if commit_hash:
-                messages.success(request, f"Committed to {db_alias}: {commit_hash[:8]}")
+                messages.success(
+                    request, f"Committed to {db_alias}: {commit_hash[:_HASH_LEN]}"
+                )
             else:
                 messages.info(request, f"No changes to commit in {db_alias}")
         except Exception as e:
@@ -91,6 +113,8 @@ def register_branch_extension(db_alias: str, extension: dict[str, Any]) -> None:
     Extension dict can contain:
       - get_extra_urls: callable(model_admin) -> list[URLPattern]
       - get_changelist_context: callable(request, db_alias) -> dict
+        (use ``get_request_branch(request, db_alias)`` to read the active
+        branch without an extra query per call)
       - changelist_template: str (template path to include in changelist)
     """
     _branch_extensions[db_alias] = extension
@@ -165,8 +189,6 @@ class DoltMultiDBAdminMixin:
             parts = name.split("_", 1)
             if len(parts) == 2:
                 model_type, db_suffix = parts
-                # e.g., "inventory_db" -> "Inventory Db"
-                db_display = db_suffix.replace("_", " ").title()
 
                 if db_suffix not in db_groups:
                     db_groups[db_suffix] = []
@@ -188,7 +210,7 @@ class DoltMultiDBAdminMixin:
         dolt_apps = []
         dolt_databases = get_dolt_databases()
         for db_suffix, models in sorted(db_groups.items()):
-            db_display = db_suffix.replace("_", " ").title()
+            db_display = get_db_display_name(db_suffix)
             # Inject a Status link if this is a known Dolt database
             if db_suffix in dolt_databases:
                 if not any(m.get("name") == "Status" for m in models):
@@ -228,9 +250,42 @@ class DoltAdminSite(DoltMultiDBAdminMixin, DoltAdminMixin, admin.AdminSite):  #
 # -----------------------------------------------------------------------------
 
 
+class _DeferringChangeList(ChangeList):
+    """ChangeList mixin that skips loading ``deferred_fields``."""
+
+    deferred_fields: tuple[str, ...] = ()
+
+    def get_queryset(
+        self,
+        request: HttpRequest,
+        exclude_parameters: list[str | None] | None = None,
+    ) -> Any:
+        qs = super().get_queryset(request, exclude_parameters)
+        return qs.defer(*self.deferred_fields)
+
+
 class ReadOnlyModelAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
     """Base class for read-only model admins."""
 
+    # Columns not fetched for list pages unless list_display shows them;
+    # the change view still loads every field.
+    changelist_defer: tuple[str, ...] = ()
+
+    def get_changelist(self, request: HttpRequest, **kwargs: Any) -> type[ChangeList]:
+        changelist = super().get_changelist(request, **kwargs)
+        displayed = set(self.get_list_display(request))
+        defer = tuple(f for f in self.changelist_defer if f not in displayed)
+        if not defer:
+            return changelist
+        return cast(
+            type[ChangeList],
+            type(
+                "DeferringChangeList",
+                (_DeferringChangeList, changelist),
+                {"deferred_fields": defer},
+            ),
+        )
+
     def has_add_permission(self, request: HttpRequest) -> bool:
         return False
 
@@ -247,10 +302,11 @@ class BaseBranchAdmin(ReadOnlyModelAdmin):
     list_display = ["name", "hash_short", "latest_committer", "latest_commit_date"]
     search_fields = ["name", "latest_committer"]
     ordering = ["name"]
+    changelist_defer = ("latest_committer_email", "latest_commit_message")
 
     @admin.display(description="Hash")
     def hash_short(self, obj: Branch) -> str:
-        return obj.hash[:8]
+        return obj.hash[:_HASH_LEN]
 
 
 class BaseCommitAdmin(ReadOnlyModelAdmin):
@@ -261,16 +317,18 @@ class BaseCommitAdmin(ReadOnlyModelAdmin):
     search_fields = ["commit_hash", "committer", "message"]
     ordering = ["-date"]
     list_per_page = 50
+    changelist_defer = ("email",)
 
     @admin.display(description="Hash")
     def hash_short(self, obj: Commit) -> str:
-        return obj.commit_hash[:8]
+        return obj.commit_hash[:_HASH_LEN]
 
     @admin.display(description="Message")
     def message_preview(self, obj: Commit) -> str:
-        if len(obj.message) > 60:
-            return obj.message[:60] + "..."
-        return obj.message
+        message = obj.message
+        if len(message) > _MESSAGE_PREVIEW_LEN:
+            return message[:_MESSAGE_PREVIEW_LEN] + "..."
+        return message
 
 
 class BaseRemoteAdmin(ReadOnlyModelAdmin):
@@ -279,6 +337,7 @@ class BaseRemoteAdmin(ReadOnlyModelAdmin):
     list_display = ["name", "url"]
     search_fields = ["name", "url"]
     ordering = ["name"]
+    changelist_defer = ("fetch_specs", "params")
 
 
 # -----------------------------------------------------------------------------
@@ -351,6 +410,10 @@ def register_dolt_admin(db_alias: str, site: admin.AdminSite | None = None) -> N
     target_site.register(RemoteProxy, DynamicRemoteAdmin)
 
 
+# Stand-in table name used to reverse the diff URL once per status page
+_TABLE_NAME_PLACEHOLDER = "__table_name__"
+
+
 def _make_status_view(db_alias: str, site: admin.AdminSite | None = None) -> Any:
     """Create a status view function for a specific database."""
     admin_site = site or admin.site
@@ -368,7 +431,9 @@ def _make_status_view(db_alias: str, site: admin.AdminSite | None = None) -> Any
                     using=db_alias,
                 )
                 if result:
-                    messages.success(request, f"Committed to {db_alias}: {result[:8]}")
+                    messages.success(
+                        request, f"Committed to {db_alias}: {result[:_HASH_LEN]}"
+                    )
                 else:
                     messages.info(request, f"No changes to commit in {db_alias}")
             except services.DoltError as e:
@@ -377,16 +442,23 @@ def _make_status_view(db_alias: str, site: admin.AdminSite | None = None) -> Any
 
         # GET: show status
         status = services.dolt_status(exclude_ignored=True, using=db_alias)
-        for item in status:
-            item["diff_url"] = reverse(
+        # Reverse the diff URL once and fill in each table name, rather
+        # than walking the URL resolver for every changed table.
+        if status:
+            diff_url = reverse(
                 "admin:dolt_diff_" + db_alias,
-                kwargs={"table_name": item["table_name"]},
+                kwargs={"table_name": _TABLE_NAME_PLACEHOLDER},
             )
+            for item in status:
+                item["diff_url"] = diff_url.replace(
+                    _TABLE_NAME_PLACEHOLDER,
+                    quote(item["table_name"], safe=RFC3986_SUBDELIMS + "/~:@"),
+                )
 
         commits = services.dolt_log(limit=10, using=db_alias)
-        current_branch = services.dolt_current_branch(using=db_alias)
+        current_branch = get_request_branch(request, db_alias)
 
-        db_display = db_alias.replace("_", " ").title()
+        db_display = get_db_display_name(db_alias)
         context = {
             **admin_site.each_context(request),
             "title": f"{db_display} — Dolt Status",
@@ -431,11 +503,13 @@ def _make_diff_view(db_alias: str, site: admin.AdminSite | None = None) -> Any:
                     seen.append(base)
             columns = seen
 
+            # Build the from_/to_ key names once, not once per cell
+            keys = [(col, f"from_{col}", f"to_{col}") for col in columns]
             for row in diff_rows:
                 cells = []
-                for col in columns:
-                    from_val = row.get(f"from_{col}")
-                    to_val = row.get(f"to_{col}")
+                for col, from_key, to_key in keys:
+                    from_val = row.get(from_key)
+                    to_val = row.get(to_key)
                     changed = from_val != to_val
                     cells.append(
                         {
@@ -452,7 +526,7 @@ def _make_diff_view(db_alias: str, site: admin.AdminSite | None = None) -> Any:
                     }
                 )
 
-        db_display = db_alias.replace("_", " ").title()
+        db_display = get_db_display_name(db_alias)
         status_url = reverse("admin:dolt_status_" + db_alias)
         context = {
             **admin_site.each_context(request),
@@ -0,0 +1,59 @@
+"""Concurrent dispatch of independent, long-running Dolt operations.
+
+Django connections are thread-local, so every worker opens its own
+connection to the target database and closes it once the call returns.
+That handshake outweighs a short read, and workers don't share the
+caller's session state (e.g. a checked-out branch), so this is meant
+for network-bound calls such as pushes rather than quick queries.
+"""
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+
+
+def _call_and_close(fn: Callable[[], Any]) -> Any:
+    """Run ``fn`` and close the worker thread's database connections."""
+    try:
+        return fn()
+    finally:
+        connections.close_all()
+
+
+def run_concurrently(
+    *calls: Callable[[], Any], max_workers: int | None = None
+) -> list[Any]:
+    """Run independent calls in parallel threads and return their results.
+
+    Intended for calls that each wait on the network for a long time,
+    like pushes to remotes. Results are returned in the order the calls
+    were given, and the first exception raised by a call propagates to
+    the caller. ``max_workers`` bounds the number of threads (default:
+    one per call).
+
+    Usage::
+
+        inventory, orders = run_concurrently(
+            partial(services.dolt_push, using="inventory"),
+            partial(services.dolt_push, using="orders"),
+        )
+    """
+    if len(calls) < 2:
+        return [fn() for fn in calls]
+    with ThreadPoolExecutor(max_workers=max_workers or len(calls)) as executor:
+        futures = [executor.submit(_call_and_close, fn) for fn in calls]
+        return [future.result() for future in futures]
+
+
+async def run_in_thread[T](fn: Callable[[], T]) -> T:
+    """Await a blocking call from async code without blocking the event loop.
+
+    The call runs on a pool thread with its own connection rather than
+    Django's single sync thread, so several awaited calls (e.g. with
+    ``asyncio.gather``) proceed at the same time.
+    """
+    result = await sync_to_async(_call_and_close, thread_sensitive=False)(fn)
+    return cast(T, result)
@@ -34,3 +34,8 @@ def reset_dolt_databases() -> None:
     """
     global _dolt_databases
     _dolt_databases = None
+
+
+def get_db_display_name(db_alias: str) -> str:
+    """Format a database alias for display (e.g. "inventory_db" -> "Inventory Db")."""
+    return db_alias.replace("_", " ").title()
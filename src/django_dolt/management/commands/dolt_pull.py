@@ -79,10 +79,10 @@ class Command(BaseCommand):
         # Show diff summary if there were actual changes
         if result != "Already up to date":
             self.stdout.write("\nChecking for changes...")
-            commits = services.dolt_log(limit=1, using=using)
-            if commits:
-                latest = commits[0]
+            latest = next(
+                services.iter_dolt_log(limit=1, short=True, using=using), None
+            )
+            if latest:
                 self.stdout.write(
-                    f"Latest commit: {latest['commit_hash'][:8]} - "
-                    f"{latest['message'].split(chr(10))[0]}"
+                    f"Latest commit: {latest['short_hash']} - {latest['first_line']}"
                 )
@@ -46,8 +46,12 @@ class Command(BaseCommand):
         branch = services.dolt_current_branch(using=using)
         self.stdout.write(f"\nBranch: {branch}")
 
-        # Check for uncommitted changes
-        status = services.dolt_status(exclude_ignored=not show_all, using=using)
+        # Check for uncommitted changes. The ignore patterns are read once
+        # and used both to filter the status and for display below.
+        ignored = services.get_ignored_tables(using=using)
+        status = services.dolt_status(
+            exclude_ignored=not show_all, patterns=ignored, using=using
+        )
 
         if status:
             self.stdout.write("\nUncommitted changes:")
@@ -56,16 +60,15 @@ class Command(BaseCommand):
             self.stdout.write("\nNo uncommitted changes")
 
         # Show ignored patterns
-        ignored = services.get_ignored_tables(using=using)
         if ignored:
             self.stdout.write(f"\nIgnored patterns: {', '.join(ignored)}")
 
         # Show recent commits if requested
         if log_count > 0:
             self.stdout.write(f"\nRecent commits (last {log_count}):")
-            commits = services.dolt_log(limit=log_count, using=using)
+            commits = services.dolt_log(limit=log_count, short=True, using=using)
             for commit in commits:
-                hash_short = commit["commit_hash"][:8]
-                date = commit["date"]
-                message = commit["message"].split("\n")[0]  # First line only
-                self.stdout.write(f"  {hash_short} {date} - {message}")
+                self.stdout.write(
+                    f"  {commit['short_hash']} {commit['date']} - "
+                    f"{commit['first_line']}"
+                )
@@ -2,10 +2,10 @@
 Django management command to sync Dolt database - commit and push changes.
 """
 
+from datetime import UTC, datetime
 from typing import Any
 
 from django.core.management.base import BaseCommand, CommandParser
-from django.utils import timezone
 
 from django_dolt import services
 
@@ -80,13 +80,13 @@ class Command(BaseCommand):
 
         # Create commit message if not provided
         if message is None:
-            timestamp = timezone.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = datetime.now(UTC).isoformat(timespec="seconds")
             message = f"Database update at {timestamp}"
 
         if tables:
-            # Explicit tables: stage each one, then commit
+            # Explicit tables: stage them in one call, then commit
+            services.dolt_add(*tables, using=using)
             for table in tables:
-                services.dolt_add(table, using=using)
                 self.stdout.write(f"  Staged: {table}")
 
             try:
@@ -8,24 +8,104 @@ procedures (``CALL DOLT_*``). Business logic and error handling live in
 the services layer.
 """
 
+import fnmatch
+import functools
+import re
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any, cast
 
 from django.db import connections, models
+from django.db.backends.utils import CursorWrapper
+from django.db.models import F, Func, OuterRef, Subquery, Value
+from django.db.models.functions import Left
+
+from django_dolt.dolt_databases import get_db_display_name
 
 if TYPE_CHECKING:
     # Type for the tuple of proxy model classes - use Any for dynamic classes
     type ProxyModelTuple = tuple[type[Any], type[Any], type[Any]]
 
 
+def _fetch_dicts(cursor: Any) -> list[dict[str, Any]]:
+    """Return all remaining rows of a raw cursor as dicts keyed by column."""
+    columns = tuple(col[0] for col in cursor.description or ())
+    return [dict(zip(columns, row, strict=False)) for row in cursor.fetchall()]
+
+
+def _like_to_glob(pattern: str) -> str:
+    """Translate a SQL ``LIKE`` pattern into an ``fnmatch`` glob."""
+    glob: list[str] = []
+    escaped = False
+    for ch in pattern:
+        if escaped:
+            glob.append(f"[{ch}]" if ch in "*?[" else ch)
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif ch == "%":
+            glob.append("*")
+        elif ch == "_":
+            glob.append("?")
+        elif ch in "*?[":
+            glob.append(f"[{ch}]")
+        else:
+            glob.append(ch)
+    if escaped:
+        glob.append("\\")
+    return "".join(glob)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_ignore_re(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile ``dolt_ignore`` patterns into one regex matching any of them."""
+    return re.compile(
+        "|".join(fnmatch.translate(_like_to_glob(pattern)) for pattern in patterns)
+    )
+
+
+def filter_ignored_rows(
+    rows: list[dict[str, Any]], patterns: list[str]
+) -> list[dict[str, Any]]:
+    """Drop status rows whose ``table_name`` matches a ``dolt_ignore`` pattern.
+
+    Patterns use SQL ``LIKE`` syntax (``%`` and ``_`` wildcards) and match
+    case-sensitively, as Dolt's default binary collation does.
+    """
+    if not patterns:
+        return rows
+    ignored = _compile_ignore_re(tuple(patterns)).match
+    return [row for row in rows if not ignored(row["table_name"])]
+
+
 # ---------------------------------------------------------------------------
 # Stored-procedure access (no backing table)
 # ---------------------------------------------------------------------------
 
 
-def dolt_add(table: str = ".", *, using: str | None = None) -> None:
-    """Execute ``CALL DOLT_ADD(table)``."""
+@functools.lru_cache(maxsize=64)
+def _call_sql(procedure: str, arg_count: int) -> str:
+    """Return ``CALL procedure(%s, ...)`` with one placeholder per argument.
+
+    ``procedure`` is always a literal from this module; arguments are
+    passed as query parameters, never interpolated.
+    """
+    placeholders = ", ".join(["%s"] * arg_count)
+    return f"CALL {procedure}({placeholders})"
+
+
+def dolt_add(
+    *tables: str, table: str | None = None, using: str | None = None
+) -> None:
+    """Execute ``CALL DOLT_ADD(tables...)``.
+
+    All tables are staged in a single call. ``table`` is the original
+    single-table keyword and is staged along with ``tables``. Stages
+    everything (``"."``) when no tables are given.
+    """
+    args = [*tables, table] if table is not None else list(tables)
+    args = args or ["."]
     with connections[using if using is not None else "default"].cursor() as cursor:
-        cursor.execute("CALL DOLT_ADD(%s)", [table])
+        cursor.execute(_call_sql("DOLT_ADD", len(args)), args)
 
 
 def dolt_commit(
@@ -48,10 +128,7 @@ def dolt_commit(
         if allow_empty:
             args.append("--allow-empty")
 
-        placeholders = ", ".join(["%s"] * len(args))
-        cursor.execute(
-            f"CALL DOLT_COMMIT({placeholders})", args  # noqa: S608
-        )
+        cursor.execute(_call_sql("DOLT_COMMIT", len(args)), args)
         result = cursor.fetchone()
         return str(result[0]) if result else None
 
@@ -71,10 +148,7 @@ def dolt_push(
 ) -> None:
     """Execute ``CALL DOLT_PUSH(...)``."""
     with connections[using if using is not None else "default"].cursor() as cursor:
-        placeholders = ", ".join(["%s"] * len(args))
-        cursor.execute(  # noqa: S608
-            f"CALL DOLT_PUSH({placeholders})", args
-        )
+        cursor.execute(_call_sql("DOLT_PUSH", len(args)), args)
 
 
 def dolt_pull(
@@ -82,10 +156,7 @@ def dolt_pull(
 ) -> tuple[Any, ...] | None:
     """Execute ``CALL DOLT_PULL(...)`` and return the result row."""
     with connections[using if using is not None else "default"].cursor() as cursor:
-        placeholders = ", ".join(["%s"] * len(args))
-        cursor.execute(  # noqa: S608
-            f"CALL DOLT_PULL({placeholders})", args
-        )
+        cursor.execute(_call_sql("DOLT_PULL", len(args)), args)
         result: tuple[Any, ...] | None = cursor.fetchone()
         return result
 
@@ -95,10 +166,16 @@ def dolt_fetch(
 ) -> None:
     """Execute ``CALL DOLT_FETCH(...)``."""
     with connections[using if using is not None else "default"].cursor() as cursor:
-        placeholders = ", ".join(["%s"] * len(args))
-        cursor.execute(  # noqa: S608
-            f"CALL DOLT_FETCH({placeholders})", args
-        )
+        cursor.execute(_call_sql("DOLT_FETCH", len(args)), args)
+
+
+def _diff_query(
+    from_ref: str, to_ref: str, table: str | None
+) -> tuple[str, list[str]]:
+    """Return the SQL and params for a ``dolt_diff``/``dolt_diff_summary`` read."""
+    if table:
+        return "SELECT * FROM dolt_diff(%s, %s, %s)", [from_ref, to_ref, table]
+    return "SELECT * FROM dolt_diff_summary(%s, %s)", [from_ref, to_ref]
 
 
 def dolt_diff(
@@ -114,23 +191,54 @@ def dolt_diff(
     SQL is required.
     """
     with connections[using if using is not None else "default"].cursor() as cursor:
-        if table:
-            cursor.execute(
-                "SELECT * FROM dolt_diff(%s, %s, %s)",
-                [from_ref, to_ref, table],
-            )
-        else:
-            cursor.execute(
-                "SELECT * FROM dolt_diff_summary(%s, %s)",
-                [from_ref, to_ref],
-            )
-        columns = [
-            col[0] for col in cursor.description or []
-        ]
-        return [
-            dict(zip(columns, row, strict=False))
-            for row in cursor.fetchall()
-        ]
+        cursor.execute(*_diff_query(from_ref, to_ref, table))
+        return _fetch_dicts(cursor)
+
+
+def _unbuffered_cursor(using: str | None) -> CursorWrapper:
+    """Open a Django-wrapped unbuffered (server-side) cursor on ``using``.
+
+    Follows ``BaseDatabaseWrapper._cursor()`` step for step, swapping in
+    the driver's ``SSCursor``. The wrapper translates driver errors
+    (flagging a broken connection for discarding) and logs the query
+    when debugging.
+    """
+    connection = connections[using if using is not None else "default"]
+    connection.close_if_health_check_failed()
+    connection.ensure_connection()
+    # Database is the backend's driver module: mysqlclient, or pymysql
+    # registered via pymysql.install_as_MySQLdb()
+    unbuffered = connection.Database.cursors.SSCursor  # type: ignore[attr-defined]
+    with connection.wrap_database_errors:
+        raw_cursor = connection.connection.cursor(unbuffered)
+        connection.validate_thread_sharing()
+        if connection.queries_logged:
+            return connection.make_debug_cursor(raw_cursor)
+        return connection.make_cursor(raw_cursor)
+
+
+def iter_dolt_diff(
+    from_ref: str,
+    to_ref: str,
+    table: str | None = None,
+    *,
+    using: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Stream ``dolt_diff()`` rows through an unbuffered cursor.
+
+    Same rows as ``dolt_diff()``, but the driver reads them from the
+    server as they are consumed instead of buffering the whole result.
+    The connection cannot run other queries until the iterator is
+    exhausted or closed.
+    """
+    cursor = _unbuffered_cursor(using)
+    try:
+        cursor.execute(*_diff_query(from_ref, to_ref, table))
+        columns = tuple(col[0] for col in cursor.description or ())
+        for row in cursor:
+            yield dict(zip(columns, row, strict=False))
+    finally:
+        cursor.close()
 
 
 # ---------------------------------------------------------------------------
@@ -161,24 +269,98 @@ class BranchManager(models.Manager["Branch"]):
 class CommitManager(models.Manager["Commit"]):
     """Manager for dolt_log system table."""
 
+    def _recent_values(
+        self,
+        limit: int,
+        short: bool,
+        decorate: bool,
+        using: str | None,
+    ) -> "models.QuerySet[Commit, dict[str, Any]]":
+        """Build the ``values()`` queryset shared by ``recent`` and ``iter_recent``."""
+        qs = self.using(using) if using else self.all()
+        extra: dict[str, Any] = {}
+        if decorate:
+            # Correlated subquery rather than a JOIN so a commit that heads
+            # several branches still yields a single row
+            extra["branch_name"] = Subquery(
+                Branch.objects.filter(hash=OuterRef("commit_hash"))
+                .order_by("name")
+                .values("name")[:1]
+            )
+        if short:
+            return cast(
+                "models.QuerySet[Commit, dict[str, Any]]",
+                qs.order_by().values(
+                    "commit_hash", "committer", "email", "date",
+                    short_hash=Left("commit_hash", 8),
+                    first_line=Func(
+                        F("message"), Value("\n"), Value(1),
+                        function="SUBSTRING_INDEX",
+                        output_field=models.TextField(),
+                    ),
+                    **extra,
+                )[:limit],
+            )
+        return cast(
+            "models.QuerySet[Commit, dict[str, Any]]",
+            qs.order_by().values(
+                "commit_hash", "committer", "email",
+                "date", "message", **extra,
+            )[:limit],
+        )
+
     def recent(
-        self, limit: int = 50, *, using: str | None = None
+        self,
+        limit: int = 50,
+        short: bool = False,
+        *,
+        decorate: bool = False,
+        using: str | None = None,
     ) -> list[dict[str, Any]]:
         """Return recent commits as dicts.
 
         Uses ``order_by()`` with no args to preserve Dolt's native
         graph ordering (parent-child) from the ``dolt_log`` table.
+
+        When ``short`` is True, the full message is not fetched. Instead
+        the database computes ``short_hash`` (first 8 characters of the
+        hash) and ``first_line`` (first line of the message).
+
+        When ``decorate`` is True, each row also carries ``branch_name``:
+        the branch whose head is that commit (first by name), or None.
         """
-        qs = self.using(using) if using else self.all()
-        return cast(
-            list[dict[str, Any]],
-            list(
-                qs.order_by().values(
-                    "commit_hash", "committer", "email",
-                    "date", "message",
-                )[:limit]
-            ),
-        )
+        return list(self._recent_values(limit, short, decorate, using))
+
+    def iter_recent(
+        self,
+        limit: int = 50,
+        short: bool = False,
+        *,
+        decorate: bool = False,
+        using: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream recent commits through an unbuffered cursor.
+
+        Same rows as ``recent()``, but the driver reads them from the
+        server as they are consumed instead of buffering the whole
+        result. The connection cannot run other queries until the
+        iterator is exhausted or closed.
+        """
+        qs = self._recent_values(limit, short, decorate, using)
+        compiler = qs.query.get_compiler(using=qs.db)
+        sql, params = compiler.as_sql()
+        # Apply the backend's converters (e.g. aware datetimes) the way
+        # QuerySet iteration would
+        fields = [col for col, _, _ in compiler.select[: compiler.col_count]]
+        converters = compiler.get_converters(fields)
+        cursor = _unbuffered_cursor(qs.db)
+        try:
+            cursor.execute(sql, params)
+            columns = tuple(col[0] for col in cursor.description or ())
+            for row in compiler.apply_converters(cursor, converters):
+                yield dict(zip(columns, row, strict=False))
+        finally:
+            cursor.close()
 
 
 class StatusManager(models.Manager["Status"]):
@@ -192,33 +374,18 @@ class StatusManager(models.Manager["Status"]):
     ) -> list[dict[str, Any]]:
         """Return current working-set status rows.
 
-        When ``exclude_ignored`` is True, a ``NOT EXISTS`` subquery
-        with ``LIKE`` matching against ``dolt_ignore`` is used, which
-        cannot be cleanly expressed in the ORM, so raw SQL is required.
+        When ``exclude_ignored`` is True, ``dolt_ignore`` is read once and
+        rows matching an ignored pattern are dropped in Python, rather than
+        running a correlated ``LIKE`` subquery per status row.
         """
+        qs = self.using(using) if using else self.all()
+        rows = cast(
+            list[dict[str, Any]],
+            list(qs.values("table_name", "staged", "status")),
+        )
         if not exclude_ignored:
-            qs = self.using(using) if using else self.all()
-            return cast(
-                list[dict[str, Any]],
-                list(qs.values("table_name", "staged", "status")),
-            )
-
-        with connections[using if using is not None else "default"].cursor() as cursor:
-            cursor.execute("""
-                SELECT s.* FROM dolt_status s
-                WHERE NOT EXISTS (
-                    SELECT 1 FROM dolt_ignore i
-                    WHERE i.ignored = 1
-                    AND s.table_name LIKE i.pattern
-                )
-            """)
-            columns = [
-                col[0] for col in cursor.description or []
-            ]
-            return [
-                dict(zip(columns, row, strict=False))
-                for row in cursor.fetchall()
-            ]
+            return rows
+        return filter_ignored_rows(rows, Ignore.objects.patterns(using=using))
 
 
 class IgnoreManager(models.Manager["Ignore"]):
@@ -369,8 +536,7 @@ def create_proxy_models(db_alias: str) -> "ProxyModelTuple":
     # Create unique class names to avoid conflicts
     class_suffix = db_alias.replace("-", "_").replace(".", "_")
 
-    # Format db_alias for display (e.g., "inventory_db" -> "Inventory Db")
-    display_name = db_alias.replace("_", " ").title()
+    display_name = get_db_display_name(db_alias)
 
     # Use type() to create classes with unique names from the start
     # This avoids Django's model registration conflict
@@ -6,7 +6,13 @@ is delegated to model managers and functions in
 ``django_dolt.models``.
 """
 
+import functools
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from functools import partial
 from typing import Any
 
 
@@ -26,23 +32,157 @@ class DoltPullError(DoltError):
     """Raised when a Dolt pull fails."""
 
 
+# ---------------------------------------------------------------------------
+# Short-lived read cache
+# ---------------------------------------------------------------------------
+
+# (function name, db alias, args, kwargs) -> (monotonic timestamp, value, tables)
+_read_cache: OrderedDict[tuple[Any, ...], tuple[float, Any, tuple[str, ...]]] = (
+    OrderedDict()
+)
+_read_cache_lock = threading.Lock()
+# Bumped on every invalidation so a read that raced a write is not stored
+_read_cache_generation = 0
+
+
+def _copy_result(value: Any) -> Any:
+    """Copy a cached list (and its dict rows) so callers can't mutate it."""
+    if isinstance(value, list):
+        return [dict(row) if isinstance(row, dict) else row for row in value]
+    return value
+
+
+def _cached_read[**P, T](
+    *tables: str,
+) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """Cache a read for ``DOLT_CACHE_TTL`` seconds, keyed on its arguments.
+
+    Opt-in: caching is off unless ``DOLT_CACHE_TTL`` is set above 0.
+    Entries are shared by all threads of the process, so only enable it
+    when connections don't switch branches per session.
+
+    ``tables`` names the Dolt system tables the read depends on; writes
+    made through this module drop matching entries via ``_invalidate()``.
+    At most ``DOLT_CACHE_SIZE`` entries are kept, least recently used
+    evicted first.
+    """
+
+    def decorator(fn: Callable[P, T]) -> Callable[P, T]:
+        @functools.wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            from django.conf import settings
+
+            ttl = getattr(settings, "DOLT_CACHE_TTL", 0)
+            if ttl <= 0:
+                return fn(*args, **kwargs)
+
+            using = kwargs.get("using")
+            alias = using if using is not None else "default"
+            params = tuple(sorted(kv for kv in kwargs.items() if kv[0] != "using"))
+            key = (fn.__name__, alias, args, params)
+            now = time.monotonic()
+            with _read_cache_lock:
+                cached = _read_cache.get(key)
+                if cached is not None and now - cached[0] < ttl:
+                    _read_cache.move_to_end(key)
+                    return _copy_result(cached[1])  # type: ignore[no-any-return]
+                generation = _read_cache_generation
+
+            value = fn(*args, **kwargs)
+
+            with _read_cache_lock:
+                if generation == _read_cache_generation:
+                    _read_cache[key] = (now, value, tables)
+                    _read_cache.move_to_end(key)
+                    max_size = getattr(settings, "DOLT_CACHE_SIZE", 256)
+                    while len(_read_cache) > max_size:
+                        _read_cache.popitem(last=False)
+            return _copy_result(value)  # type: ignore[no-any-return]
+
+        return wrapper
+
+    return decorator
+
+
+def _invalidate(*tables: str, using: str | None = None) -> None:
+    """Drop cached reads of ``using`` that depend on any of ``tables``."""
+    global _read_cache_generation
+
+    alias = using if using is not None else "default"
+    with _read_cache_lock:
+        _read_cache_generation += 1
+        stale = [
+            key
+            for key, (_, _, read_tables) in _read_cache.items()
+            if key[1] == alias and not set(read_tables).isdisjoint(tables)
+        ]
+        for key in stale:
+            del _read_cache[key]
+
+
+def invalidate_caches(*, using: str | None = None) -> None:
+    """Drop cached reads for one database, or for all when ``using`` is None."""
+    global _read_cache_generation
+
+    with _read_cache_lock:
+        _read_cache_generation += 1
+        if using is None:
+            _read_cache.clear()
+            return
+        for key in [k for k in _read_cache if k[1] == using]:
+            del _read_cache[key]
+
+
 # ---------------------------------------------------------------------------
 # Write operations
 # ---------------------------------------------------------------------------
 
 
-def dolt_add(table: str = ".", *, using: str | None = None) -> None:
+def _get_default_user() -> str:
+    """Return the remote username from ``DOLT_REMOTE_USER`` (empty if unset).
+
+    Read per call so the variable can be set after import.
+    """
+    return os.environ.get("DOLT_REMOTE_USER", "")
+
+
+def _is_nothing_to_commit(error: Exception) -> bool:
+    """Return True if a failed commit only means there were no changes."""
+    return "nothing to commit" in str(error).lower()
+
+
+def dolt_add(
+    *tables: str, table: str | None = None, using: str | None = None
+) -> None:
     """Stage table(s) for commit.
 
+    All tables are staged with a single ``DOLT_ADD`` call. If that call
+    fails, the tables are retried one at a time so the error names the
+    table that could not be staged. Stages all tables when none are given.
+    ``dolt_add(table="x")`` still works and is the same as ``dolt_add("x")``.
+
     Raises:
         DoltError: If the add operation fails
     """
     from django_dolt import models
 
+    if table is not None:
+        tables = (*tables, table)
+    if not tables:
+        tables = (".",)
+
     try:
-        models.dolt_add(table, using=using)
+        models.dolt_add(*tables, using=using)
     except Exception as e:
-        raise DoltError(f"Failed to stage '{table}': {e}") from e
+        if len(tables) == 1:
+            raise DoltError(f"Failed to stage '{tables[0]}': {e}") from e
+        for table in tables:
+            try:
+                models.dolt_add(table, using=using)
+            except Exception as table_error:
+                raise DoltError(
+                    f"Failed to stage '{table}': {table_error}"
+                ) from table_error
 
 
 def dolt_commit(
@@ -63,13 +203,15 @@ def dolt_commit(
     from django_dolt import models
 
     try:
-        return models.dolt_commit(
+        commit_hash = models.dolt_commit(
             message, author, allow_empty=allow_empty, using=using
         )
     except Exception as e:
-        if "nothing to commit" in str(e).lower():
+        if _is_nothing_to_commit(e):
             return None
         raise DoltCommitError(f"Failed to commit: {e}") from e
+    _invalidate("dolt_log", "dolt_branches", using=using)
+    return commit_hash
 
 
 def dolt_add_and_commit(
@@ -90,13 +232,15 @@ def dolt_add_and_commit(
     from django_dolt import models
 
     try:
-        return models.dolt_commit(
+        commit_hash = models.dolt_commit(
             message, author, stage_all=True, using=using
         )
     except Exception as e:
-        if "nothing to commit" in str(e).lower():
+        if _is_nothing_to_commit(e):
             return None
         raise DoltCommitError(f"Failed to commit: {e}") from e
+    _invalidate("dolt_log", "dolt_branches", using=using)
+    return commit_hash
 
 
 def dolt_add_remote(
@@ -115,6 +259,7 @@ def dolt_add_remote(
         raise DoltError(
             f"Failed to add remote '{name}': {e}"
         ) from e
+    _invalidate("dolt_remotes", using=using)
 
 
 def dolt_push(
@@ -133,7 +278,7 @@ def dolt_push(
     from django_dolt import models
 
     if user is None:
-        user = os.environ.get("DOLT_REMOTE_USER", "")
+        user = _get_default_user()
 
     try:
         push_args: list[str] = []
@@ -157,6 +302,40 @@ def dolt_push(
         raise DoltPushError(f"Push failed: {error_msg}") from e
 
 
+def dolt_push_many(
+    databases: list[str],
+    remote: str = "origin",
+    branch: str = "main",
+    force: bool = False,
+    user: str | None = None,
+    *,
+    max_workers: int = 4,
+) -> list[tuple[str, bool, str]]:
+    """Push several Dolt databases concurrently.
+
+    Each database is pushed from a worker thread on its own connection,
+    so the network time of the pushes overlaps. A failed push does not
+    stop the others.
+
+    Returns:
+        ``(db_alias, ok, message)`` for each database, in input order.
+        ``message`` is the push result or the error text.
+    """
+    from django_dolt.concurrency import run_concurrently
+
+    def push(db_alias: str) -> tuple[str, bool, str]:
+        try:
+            result = dolt_push(remote, branch, force, user, using=db_alias)
+        except DoltPushError as e:
+            return (db_alias, False, str(e))
+        return (db_alias, True, result)
+
+    return run_concurrently(
+        *(partial(push, db_alias) for db_alias in databases),
+        max_workers=max_workers,
+    )
+
+
 def dolt_pull(
     remote: str = "origin",
     branch: str | None = None,
@@ -172,10 +351,15 @@ def dolt_pull(
     from django_dolt import models
 
     if user is None:
-        user = os.environ.get("DOLT_REMOTE_USER", "")
+        user = _get_default_user()
 
     if branch is None:
-        branch = dolt_current_branch(using=using)
+        # Always ask the session, never the read cache: a stale branch
+        # name here would pull into the wrong branch
+        try:
+            branch = models.Branch.objects.active_branch(using=using)
+        except Exception as e:
+            raise DoltError(f"Failed to get current branch: {e}") from e
 
     try:
         pull_args: list[str] = []
@@ -184,6 +368,7 @@ def dolt_pull(
         pull_args.extend([remote, branch])
 
         result = models.dolt_pull(pull_args, using=using)
+        _invalidate("dolt_log", "dolt_branches", using=using)
         if result:
             fast_forward = result[0]
             conflicts = result[1] if len(result) > 1 else 0
@@ -211,7 +396,7 @@ def dolt_fetch(
     from django_dolt import models
 
     if user is None:
-        user = os.environ.get("DOLT_REMOTE_USER", "")
+        user = _get_default_user()
 
     try:
         fetch_args: list[str] = []
@@ -225,41 +410,150 @@ def dolt_fetch(
         raise DoltError(f"Fetch failed: {e}") from e
 
 
+async def dolt_push_async(
+    remote: str = "origin",
+    branch: str = "main",
+    force: bool = False,
+    user: str | None = None,
+    *,
+    using: str | None = None,
+) -> str:
+    """Async ``dolt_push()``, for awaiting several pushes with ``asyncio.gather``.
+
+    Raises:
+        DoltPushError: If push fails
+    """
+    from django_dolt.concurrency import run_in_thread
+
+    return await run_in_thread(
+        partial(dolt_push, remote, branch, force, user, using=using)
+    )
+
+
+async def dolt_pull_async(
+    remote: str = "origin",
+    branch: str | None = None,
+    user: str | None = None,
+    *,
+    using: str | None = None,
+) -> str:
+    """Async ``dolt_pull()``.
+
+    Raises:
+        DoltPullError: If pull fails
+    """
+    from django_dolt.concurrency import run_in_thread
+
+    return await run_in_thread(partial(dolt_pull, remote, branch, user, using=using))
+
+
+async def dolt_fetch_async(
+    remote: str = "origin",
+    user: str | None = None,
+    *,
+    using: str | None = None,
+) -> str:
+    """Async ``dolt_fetch()``.
+
+    Raises:
+        DoltError: If fetch fails
+    """
+    from django_dolt.concurrency import run_in_thread
+
+    return await run_in_thread(partial(dolt_fetch, remote, user, using=using))
+
+
 # ---------------------------------------------------------------------------
 # Read operations — thin wrappers around model managers
 # ---------------------------------------------------------------------------
 
 
 def dolt_status(
-    exclude_ignored: bool = True, *, using: str | None = None
+    exclude_ignored: bool = True,
+    *,
+    patterns: list[str] | None = None,
+    using: str | None = None,
 ) -> list[dict[str, Any]]:
     """Get the current Dolt working set status.
 
+    Ignored tables are filtered out against ``patterns``, or the patterns
+    from ``get_ignored_tables()`` when not given. Pass them if you already
+    read them, to skip a second ``dolt_ignore`` query.
+
     Raises:
         DoltError: If the status query fails
     """
     from django_dolt import models
 
     try:
-        return models.Status.objects.current(
-            exclude_ignored=exclude_ignored, using=using
-        )
+        rows = models.Status.objects.current(exclude_ignored=False, using=using)
     except Exception as e:
         raise DoltError(f"Failed to get status: {e}") from e
+    if exclude_ignored:
+        if patterns is None:
+            patterns = get_ignored_tables(using=using)
+        rows = models.filter_ignored_rows(rows, patterns)
+    return rows
 
 
+@_cached_read("dolt_log")
 def dolt_log(
-    limit: int = 50, *, using: str | None = None
+    limit: int = 50,
+    short: bool = False,
+    *,
+    decorate: bool = False,
+    using: str | None = None,
 ) -> list[dict[str, Any]]:
     """Get recent commit history.
 
+    With ``short=True`` each row carries ``short_hash`` and ``first_line``
+    (computed by the database) instead of the full ``message``.
+    With ``decorate=True`` each row also carries ``branch_name``, the
+    branch whose head is that commit (None for other commits), fetched in
+    the same query.
+
     Raises:
         DoltError: If the log query fails
     """
     from django_dolt import models
 
     try:
-        return models.Commit.objects.recent(limit=limit, using=using)
+        return models.Commit.objects.recent(
+            limit=limit,
+            short=short,
+            decorate=decorate,
+            using=using,
+        )
+    except Exception as e:
+        raise DoltError(f"Failed to get log: {e}") from e
+
+
+def iter_dolt_log(
+    limit: int = 50,
+    short: bool = False,
+    *,
+    decorate: bool = False,
+    using: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield recent commits one at a time instead of building a list.
+
+    Takes the same arguments as ``dolt_log()``. Rows are streamed from
+    the server, so large ``limit`` values never hold every commit in
+    memory at once. Consume or close the iterator before running other
+    queries on ``using``.
+
+    Raises:
+        DoltError: If the log query fails
+    """
+    from django_dolt import models
+
+    try:
+        yield from models.Commit.objects.iter_recent(
+            limit=limit,
+            short=short,
+            decorate=decorate,
+            using=using,
+        )
     except Exception as e:
         raise DoltError(f"Failed to get log: {e}") from e
 
@@ -284,6 +578,31 @@ def dolt_diff(
         raise DoltError(f"Failed to get diff: {e}") from e
 
 
+def iter_dolt_diff(
+    from_ref: str = "HEAD",
+    to_ref: str = "WORKING",
+    table: str | None = None,
+    *,
+    using: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield diff rows one at a time instead of building a list.
+
+    Takes the same arguments as ``dolt_diff()``. Rows are streamed from
+    the server, so large diffs are never held in memory at once. Consume
+    or close the iterator before running other queries on ``using``.
+
+    Raises:
+        DoltError: If the diff query fails
+    """
+    from django_dolt import models
+
+    try:
+        yield from models.iter_dolt_diff(from_ref, to_ref, table, using=using)
+    except Exception as e:
+        raise DoltError(f"Failed to get diff: {e}") from e
+
+
+@_cached_read("dolt_branches")
 def dolt_branch_list(
     *, using: str | None = None
 ) -> list[str]:
@@ -300,6 +619,7 @@ def dolt_branch_list(
         raise DoltError(f"Failed to list branches: {e}") from e
 
 
+@_cached_read("dolt_branches")
 def dolt_current_branch(
     *, using: str | None = None
 ) -> str:
@@ -332,6 +652,7 @@ def get_ignored_tables(
         raise DoltError(f"Failed to get ignored tables: {e}") from e
 
 
+@_cached_read("dolt_remotes")
 def dolt_remotes(
     *, using: str | None = None
 ) -> list[dict[str, Any]]:
@@ -360,12 +681,8 @@ def format_status_rows(
     if not status_rows:
         return "No changes"
 
-    output = []
-    for row in status_rows:
-        staged = (
-            "staged" if row.get("staged", 0) else "unstaged"
-        )
-        table = row.get("table_name", "unknown")
-        status = row.get("status", "")
-        output.append(f"  {staged}: {table} ({status})")
-    return "\n".join(output)
+    return "\n".join(
+        f"  {'staged' if row.get('staged', 0) else 'unstaged'}: "
+        f"{row.get('table_name', 'unknown')} ({row.get('status', '')})"
+        for row in status_rows
+    )
@@ -12,6 +12,7 @@ from django_dolt.admin import (
     ReadOnlyModelAdmin,
     _make_diff_view,
     _make_status_view,
+    get_request_branch,
     register_dolt_admin,
 )
 
@@ -102,6 +103,25 @@ class TestDoltCommitMixin(TestCase):
         mock_commit.assert_called_once()
 
 
+class TestGetRequestBranch:
+    """Test get_request_branch request-scoped caching."""
+
+    @patch("django_dolt.admin.services.dolt_current_branch", return_value="main")
+    def test_queries_once_per_request(self, mock_branch: MagicMock) -> None:
+        request = RequestFactory().get("/")
+        assert get_request_branch(request, "db1") == "main"
+        assert get_request_branch(request, "db1") == "main"
+        mock_branch.assert_called_once_with(using="db1")
+
+    @patch("django_dolt.admin.services.dolt_current_branch")
+    def test_cached_per_database(self, mock_branch: MagicMock) -> None:
+        mock_branch.side_effect = lambda using: f"{using}-branch"
+        request = RequestFactory().get("/")
+        assert get_request_branch(request, "db1") == "db1-branch"
+        assert get_request_branch(request, "db2") == "db2-branch"
+        assert mock_branch.call_count == 2
+
+
 @pytest.mark.django_db
 class TestMakeStatusView(TestCase):
     """Test _make_status_view."""
@@ -130,6 +150,36 @@ class TestMakeStatusView(TestCase):
         assert response.status_code == 200
         assert response.template_name == "admin/django_dolt/status.html"
 
+    @patch("django_dolt.admin.reverse")
+    @patch("django_dolt.admin.services.dolt_log", return_value=[])
+    @patch("django_dolt.admin.services.dolt_current_branch", return_value="main")
+    @patch("django_dolt.admin.services.dolt_status")
+    def test_get_builds_diff_urls_with_one_reverse(
+        self,
+        mock_status: MagicMock,
+        mock_branch: MagicMock,
+        mock_log: MagicMock,
+        mock_reverse: MagicMock,
+    ) -> None:
+        mock_status.return_value = [
+            {"table_name": "products", "staged": 0, "status": "modified"},
+            {"table_name": "my table", "staged": 0, "status": "new table"},
+        ]
+        mock_reverse.side_effect = (
+            lambda name, kwargs: f"/admin/diff/{kwargs['table_name']}/"
+        )
+        view = _make_status_view("testdb")
+        request = self.factory.get("/")
+        request.user = self.superuser
+
+        with patch("django_dolt.admin.admin.site.each_context", return_value={}):
+            response = view(request)
+
+        status = response.context_data["status"]
+        assert status[0]["diff_url"] == "/admin/diff/products/"
+        assert status[1]["diff_url"] == "/admin/diff/my%20table/"
+        mock_reverse.assert_called_once()
+
     @patch("django_dolt.admin.reverse", return_value="/admin/dolt/status/testdb/")
     @patch("django_dolt.admin.services.dolt_add_and_commit", return_value="abcdef12")
     def test_post_commits_as_superuser(
@@ -46,8 +46,9 @@ class TestDoltStatusCommand:
         mock_services.dolt_log.return_value = [
             {
                 "commit_hash": "abcdef1234567890",
+                "short_hash": "abcdef12",
                 "date": "2025-01-01",
-                "message": "Initial commit",
+                "first_line": "Initial commit",
             },
         ]
 
@@ -57,6 +58,7 @@ class TestDoltStatusCommand:
 
         assert "abcdef12" in output
         assert "Initial commit" in output
+        mock_services.dolt_log.assert_called_with(limit=5, short=True, using=None)
 
     @patch("django_dolt.management.commands.dolt_status.services")
     def test_status_with_database_flag(self, mock_services: MagicMock) -> None:
@@ -68,7 +70,10 @@ class TestDoltStatusCommand:
         call_command("dolt_status", "--database", "mydb", stdout=out)
 
         mock_services.dolt_current_branch.assert_called_with(using="mydb")
-        mock_services.dolt_status.assert_called_with(exclude_ignored=True, using="mydb")
+        mock_services.dolt_status.assert_called_with(
+            exclude_ignored=True, patterns=[], using="mydb"
+        )
+        mock_services.get_ignored_tables.assert_called_once_with(using="mydb")
 
 
 class TestDoltSyncCommand:
@@ -98,6 +103,30 @@ class TestDoltSyncCommand:
         mock_services.dolt_add.assert_called_with("products", using=None)
         mock_services.dolt_commit.assert_called_once()
 
+    @patch("django_dolt.management.commands.dolt_sync.services")
+    def test_sync_stages_multiple_tables_in_one_call(
+        self, mock_services: MagicMock
+    ) -> None:
+        mock_services.dolt_status.return_value = [
+            {"table_name": "products", "staged": 0, "status": "modified"},
+            {"table_name": "orders", "staged": 0, "status": "modified"},
+        ]
+        mock_services.format_status_rows.return_value = ""
+        mock_services.dolt_commit.return_value = "abc12345678"
+        mock_services.DoltError = Exception
+        mock_services.DoltCommitError = Exception
+
+        out = StringIO()
+        call_command(
+            "dolt_sync", "test commit", "--no-push",
+            "--tables", "products", "orders", stdout=out,
+        )
+
+        mock_services.dolt_add.assert_called_once_with(
+            "products", "orders", using=None
+        )
+        assert "Staged: orders" in out.getvalue()
+
     @patch("django_dolt.management.commands.dolt_sync.services")
     def test_sync_uses_add_and_commit_without_tables(
         self, mock_services: MagicMock
@@ -122,6 +151,7 @@ class TestDoltSyncCommand:
         # Should have auto-generated a timestamp message
         call_args = mock_services.dolt_add_and_commit.call_args
         assert "Database update at" in call_args[0][0]
+        assert call_args[0][0].endswith("+00:00")
         mock_services.dolt_add.assert_not_called()
         assert "Committed" in output
 
@@ -197,7 +227,7 @@ class TestDoltPullCommand:
     def test_pull_default(self, mock_services: MagicMock) -> None:
         mock_services.dolt_current_branch.return_value = "main"
         mock_services.dolt_pull.return_value = "Fast-forward pull successful"
-        mock_services.dolt_log.return_value = []
+        mock_services.iter_dolt_log.return_value = iter([])
         mock_services.DoltPullError = Exception
 
         out = StringIO()
@@ -207,11 +237,25 @@ class TestDoltPullCommand:
         assert "Fast-forward pull successful" in output
         mock_services.dolt_pull.assert_called_once()
 
+    @patch("django_dolt.management.commands.dolt_pull.services")
+    def test_pull_shows_latest_commit(self, mock_services: MagicMock) -> None:
+        mock_services.dolt_current_branch.return_value = "main"
+        mock_services.dolt_pull.return_value = "Fast-forward pull successful"
+        mock_services.iter_dolt_log.return_value = iter(
+            [{"short_hash": "abcdef12", "first_line": "Pulled change"}]
+        )
+        mock_services.DoltPullError = Exception
+
+        out = StringIO()
+        call_command("dolt_pull", stdout=out)
+
+        assert "Latest commit: abcdef12 - Pulled change" in out.getvalue()
+
     @patch("django_dolt.management.commands.dolt_pull.services")
     def test_pull_fetch_only(self, mock_services: MagicMock) -> None:
         mock_services.dolt_current_branch.return_value = "main"
         mock_services.dolt_fetch.return_value = "Fetched from origin"
-        mock_services.dolt_log.return_value = []
+        mock_services.iter_dolt_log.return_value = iter([])
         mock_services.DoltError = Exception
 
         out = StringIO()
@@ -225,7 +269,7 @@ class TestDoltPullCommand:
     def test_pull_with_user_flag(self, mock_services: MagicMock) -> None:
         mock_services.dolt_current_branch.return_value = "main"
         mock_services.dolt_pull.return_value = "Already up to date"
-        mock_services.dolt_log.return_value = []
+        mock_services.iter_dolt_log.return_value = iter([])
         mock_services.DoltPullError = Exception
 
         out = StringIO()
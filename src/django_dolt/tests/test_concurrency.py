@@ -0,0 +1,57 @@
+"""Tests for django_dolt.concurrency module."""
+
+import asyncio
+import threading
+
+import pytest
+
+from django_dolt.concurrency import run_concurrently, run_in_thread
+
+
+class TestRunConcurrently:
+    """Test run_concurrently dispatch."""
+
+    def test_results_keep_call_order(self) -> None:
+        results = run_concurrently(lambda: "a", lambda: "b", lambda: "c")
+        assert results == ["a", "b", "c"]
+
+    def test_calls_run_in_parallel(self) -> None:
+        """Each call waits for the other, which only works if both run at once."""
+        barrier = threading.Barrier(2, timeout=5)
+        results = run_concurrently(barrier.wait, barrier.wait)
+        assert sorted(results) == [0, 1]
+
+    def test_max_workers_bounds_threads(self) -> None:
+        results = run_concurrently(
+            threading.get_ident, threading.get_ident, max_workers=1
+        )
+        assert results[0] == results[1]
+
+    def test_single_call_runs_inline(self) -> None:
+        results = run_concurrently(threading.get_ident)
+        assert results == [threading.get_ident()]
+
+    def test_exception_propagates(self) -> None:
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_concurrently(lambda: 1, fail)
+
+
+class TestRunInThread:
+    """Test run_in_thread async dispatch."""
+
+    def test_returns_result_from_worker_thread(self) -> None:
+        ident = asyncio.run(run_in_thread(threading.get_ident))
+        assert ident != threading.get_ident()
+
+    def test_gathered_calls_run_in_parallel(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        async def both() -> tuple[int, int]:
+            return await asyncio.gather(
+                run_in_thread(barrier.wait), run_in_thread(barrier.wait)
+            )
+
+        assert sorted(asyncio.run(both())) == [0, 1]
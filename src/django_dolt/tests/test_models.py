@@ -1,12 +1,37 @@
 """Tests for django_dolt.models and admin integration."""
 
-from unittest.mock import MagicMock
+import datetime
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
+from django.contrib import admin
 from django.contrib.admin.sites import AdminSite
+from django.contrib.admin.views.main import ChangeList
+from django.db import connections
+from django.db.utils import OperationalError
 
 from django_dolt.admin import BaseBranchAdmin, BaseCommitAdmin, BaseRemoteAdmin
-from django_dolt.models import Branch, Commit, Remote
+from django_dolt.models import (
+    Branch,
+    Commit,
+    Remote,
+    _call_sql,
+    filter_ignored_rows,
+    iter_dolt_diff,
+)
+
+READ_ONLY_PERMISSIONS = [
+    "has_add_permission",
+    "has_change_permission",
+    "has_delete_permission",
+]
+
+
+@pytest.fixture(scope="module")
+def mock_request() -> MagicMock:
+    """One stand-in request shared by the permission checks."""
+    return MagicMock()
 
 
 class TestBranchModel:
@@ -75,10 +100,135 @@ class TestRemoteModel:
         assert pk_field.name == "name"
 
 
+class TestCallSql:
+    """Test the stored-procedure statement templates."""
+
+    def test_one_placeholder_per_argument(self) -> None:
+        assert _call_sql("DOLT_PUSH", 3) == "CALL DOLT_PUSH(%s, %s, %s)"
+
+    def test_template_is_reused(self) -> None:
+        assert _call_sql("DOLT_ADD", 2) is _call_sql("DOLT_ADD", 2)
+
+
+class TestIterDoltDiff:
+    """Test the unbuffered diff cursor goes through Django's wrapper."""
+
+    def test_driver_errors_are_wrapped(self) -> None:
+        connection = connections["dolt"]
+        raw_cursor = MagicMock()
+        driver = connection.Database  # type: ignore[attr-defined]
+        raw_cursor.execute.side_effect = driver.OperationalError(
+            2013, "Lost connection to MySQL server during query"
+        )
+        raw_connection = MagicMock()
+        raw_connection.cursor.return_value = raw_cursor
+
+        try:
+            with (
+                patch.object(connection, "ensure_connection"),
+                patch.object(connection, "connection", raw_connection),
+                pytest.raises(OperationalError, match="Lost connection"),
+            ):
+                list(iter_dolt_diff("HEAD", "WORKING", using="dolt"))
+            # Flagged so Django discards the connection instead of reusing it
+            assert connection.errors_occurred
+            raw_cursor.close.assert_called_once()
+        finally:
+            connection.errors_occurred = False
+
+    def test_health_check_runs_before_reuse(self) -> None:
+        connection = connections["dolt"]
+        calls = MagicMock()
+        calls.connection.cursor.return_value.description = ()
+        calls.connection.cursor.return_value.__iter__.return_value = iter(())
+
+        with (
+            patch.object(
+                connection, "close_if_health_check_failed", calls.health_check
+            ),
+            patch.object(connection, "ensure_connection", calls.ensure_connection),
+            patch.object(connection, "connection", calls.connection),
+        ):
+            assert list(iter_dolt_diff("HEAD", "WORKING", using="dolt")) == []
+
+        assert [name for name, _, _ in calls.mock_calls[:2]] == [
+            "health_check",
+            "ensure_connection",
+        ]
+
+
+class TestIterRecent:
+    """Test dolt_log rows stream through the unbuffered cursor."""
+
+    def test_streams_converted_rows(self) -> None:
+        connection = connections["dolt"]
+        raw_cursor = MagicMock()
+        raw_cursor.description = [
+            (name,) for name in ("commit_hash", "committer", "email", "date", "message")
+        ]
+        raw_cursor.__iter__.return_value = iter(
+            [("abc123", "me", "me@example.com", datetime.datetime(2026, 1, 1), "m")]
+        )
+        raw_connection = MagicMock()
+        raw_connection.cursor.return_value = raw_cursor
+
+        with (
+            patch.object(connection, "close_if_health_check_failed"),
+            patch.object(connection, "ensure_connection"),
+            patch.object(connection, "connection", raw_connection),
+        ):
+            rows = list(Commit.objects.iter_recent(limit=5, using="dolt"))
+
+        driver = connection.Database  # type: ignore[attr-defined]
+        raw_connection.cursor.assert_called_once_with(driver.cursors.SSCursor)
+        sql = raw_cursor.execute.call_args.args[0]
+        assert "FROM `dolt_log` LIMIT 5" in sql
+        # Backend converters still run, so dates match recent()
+        assert rows == [
+            {
+                "commit_hash": "abc123",
+                "committer": "me",
+                "email": "me@example.com",
+                "date": datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC),
+                "message": "m",
+            }
+        ]
+        raw_cursor.close.assert_called_once()
+
+
+class TestFilterIgnoredRows:
+    """Test matching of status rows against dolt_ignore LIKE patterns."""
+
+    @staticmethod
+    def _names(*tables: str, patterns: list[str]) -> list[str]:
+        rows = [{"table_name": table} for table in tables]
+        return [row["table_name"] for row in filter_ignored_rows(rows, patterns)]
+
+    def test_percent_and_underscore_wildcards(self) -> None:
+        assert self._names(
+            "django_session",
+            "auth_user",
+            "authors",
+            "items",
+            patterns=["django_%", "auth_", "auth_user"],
+        ) == ["authors", "items"]
+
+    def test_glob_characters_are_literal(self) -> None:
+        assert self._names("a*b", "axb", patterns=["a*b"]) == ["axb"]
+
+    def test_escaped_wildcards_are_literal(self) -> None:
+        assert self._names("a%b", "axb", patterns=["a\\%b"]) == ["axb"]
+
+    def test_match_is_case_sensitive(self) -> None:
+        assert self._names("Django_session", patterns=["django_%"]) == [
+            "Django_session"
+        ]
+
+
 class TestBaseBranchAdmin:
     """Test BaseBranchAdmin configuration."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def admin_instance(self) -> BaseBranchAdmin:
         return BaseBranchAdmin(Branch, AdminSite())
 
@@ -92,17 +242,60 @@ class TestBaseBranchAdmin:
         result = admin_instance.hash_short(branch)
         assert result == "abc123de"
 
-    def test_is_read_only(self, admin_instance: BaseBranchAdmin) -> None:
-        request = MagicMock()
-        assert admin_instance.has_add_permission(request) is False
-        assert admin_instance.has_change_permission(request) is False
-        assert admin_instance.has_delete_permission(request) is False
+    @staticmethod
+    def _deferred(model_admin: BaseBranchAdmin) -> set[str]:
+        changelist_cls = model_admin.get_changelist(MagicMock())
+        changelist = changelist_cls.__new__(changelist_cls)
+        changelist.model_admin = model_admin
+        with patch.object(
+            ChangeList, "get_queryset", return_value=Branch.objects.all()
+        ):
+            qs = changelist.get_queryset(MagicMock())
+
+        deferred, is_defer = qs.query.deferred_loading
+        assert is_defer
+        return set(deferred)
+
+    def test_changelist_defers_unlisted_fields(
+        self, admin_instance: BaseBranchAdmin
+    ) -> None:
+        assert self._deferred(admin_instance) == {
+            "latest_committer_email",
+            "latest_commit_message",
+        }
+
+    def test_changelist_loads_displayed_fields(self) -> None:
+        class MessageBranchAdmin(BaseBranchAdmin):
+            list_display = ["name", "latest_commit_message"]
+
+        model_admin = MessageBranchAdmin(Branch, AdminSite())
+        assert self._deferred(model_admin) == {"latest_committer_email"}
+
+    def test_changelist_builds_on_inherited_changelist(self) -> None:
+        class CustomChangeList(ChangeList):
+            pass
+
+        class CustomChangeListMixin(admin.ModelAdmin):  # type: ignore[type-arg]
+            def get_changelist(self, request: Any, **kwargs: Any) -> type[ChangeList]:
+                return CustomChangeList
+
+        class MixedBranchAdmin(BaseBranchAdmin, CustomChangeListMixin):
+            pass
+
+        model_admin = MixedBranchAdmin(Branch, AdminSite())
+        assert issubclass(model_admin.get_changelist(MagicMock()), CustomChangeList)
+
+    @pytest.mark.parametrize("permission", READ_ONLY_PERMISSIONS)
+    def test_is_read_only(
+        self, admin_instance: BaseBranchAdmin, mock_request: MagicMock, permission: str
+    ) -> None:
+        assert getattr(admin_instance, permission)(mock_request) is False
 
 
 class TestBaseCommitAdmin:
     """Test BaseCommitAdmin configuration."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def admin_instance(self) -> BaseCommitAdmin:
         return BaseCommitAdmin(Commit, AdminSite())
 
@@ -134,17 +327,17 @@ class TestBaseCommitAdmin:
     def test_ordering(self, admin_instance: BaseCommitAdmin) -> None:
         assert admin_instance.ordering == ["-date"]
 
-    def test_is_read_only(self, admin_instance: BaseCommitAdmin) -> None:
-        request = MagicMock()
-        assert admin_instance.has_add_permission(request) is False
-        assert admin_instance.has_change_permission(request) is False
-        assert admin_instance.has_delete_permission(request) is False
+    @pytest.mark.parametrize("permission", READ_ONLY_PERMISSIONS)
+    def test_is_read_only(
+        self, admin_instance: BaseCommitAdmin, mock_request: MagicMock, permission: str
+    ) -> None:
+        assert getattr(admin_instance, permission)(mock_request) is False
 
 
 class TestBaseRemoteAdmin:
     """Test BaseRemoteAdmin configuration."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def admin_instance(self) -> BaseRemoteAdmin:
         return BaseRemoteAdmin(Remote, AdminSite())
 
@@ -152,8 +345,18 @@ class TestBaseRemoteAdmin:
         assert "name" in admin_instance.list_display
         assert "url" in admin_instance.list_display
 
-    def test_is_read_only(self, admin_instance: BaseRemoteAdmin) -> None:
-        request = MagicMock()
-        assert admin_instance.has_add_permission(request) is False
-        assert admin_instance.has_change_permission(request) is False
-        assert admin_instance.has_delete_permission(request) is False
+    @pytest.mark.parametrize("permission", READ_ONLY_PERMISSIONS)
+    def test_is_read_only(
+        self, admin_instance: BaseRemoteAdmin, mock_request: MagicMock, permission: str
+    ) -> None:
+        assert getattr(admin_instance, permission)(mock_request) is False
+
+
+class TestLazyModelAccess:
+    """Test the package-level lazy model attributes."""
+
+    def test_resolves_model_and_caches_it(self) -> None:
+        import django_dolt
+
+        assert django_dolt.Commit is Commit
+        assert vars(django_dolt)["Commit"] is Commit
@@ -12,6 +12,7 @@ from django_dolt.admin import (
     register_branch_extension,
 )
 from django_dolt.dolt_databases import (
+    get_db_display_name,
     get_dolt_databases,
     reset_dolt_databases,
 )
@@ -72,6 +73,9 @@ class TestDoltDatabaseDiscovery:
             result = get_dolt_databases()
             assert result == []
 
+    def test_get_db_display_name(self) -> None:
+        assert get_db_display_name("inventory_db") == "Inventory Db"
+
 
 class TestProxyModelFactory:
     """Tests for proxy model creation."""
@@ -1,10 +1,12 @@
 """Tests for django_dolt.services module against a real Dolt database."""
 
+import asyncio
 from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
 from django.db import connections
+from django.test import override_settings
 
 from django_dolt import services
 from django_dolt.tests import quote_id
@@ -147,6 +149,28 @@ class TestDoltLog:
         messages = [r["message"] for r in result]
         assert "log test commit" in messages
 
+    def test_iter_log_matches_log(self, dolt_db: str) -> None:
+        services.dolt_commit("iter test", allow_empty=True, using=dolt_db)
+
+        rows = list(services.iter_dolt_log(limit=10, using=dolt_db))
+        assert rows == services.dolt_log(limit=10, using=dolt_db)
+
+    def test_log_short_projection(self, dolt_db: str) -> None:
+        """Short rows carry the abbreviated hash and first message line."""
+        services.dolt_commit("first line\nsecond line", allow_empty=True, using=dolt_db)
+
+        latest = services.dolt_log(limit=1, short=True, using=dolt_db)[0]
+        assert latest["short_hash"] == latest["commit_hash"][:8]
+        assert latest["first_line"] == "first line"
+        assert "message" not in latest
+
+    def test_log_decorate_adds_branch_name(self, dolt_db: str) -> None:
+        services.dolt_commit("decorated", allow_empty=True, using=dolt_db)
+
+        rows = services.dolt_log(limit=2, decorate=True, using=dolt_db)
+        assert rows[0]["branch_name"] == services.dolt_current_branch(using=dolt_db)
+        assert all("branch_name" in row for row in rows)
+
 
 class TestDoltBranch:
     """Test branch-related functions against real Dolt."""
@@ -214,12 +238,194 @@ class TestDoltDiff:
         )
         assert len(result) >= 1
 
+        streamed = list(services.iter_dolt_diff(
+            from_ref=log[1]["commit_hash"],
+            to_ref=log[0]["commit_hash"],
+            table="test_diff_tbl",
+            using=dolt_db,
+        ))
+        assert streamed == result
+
 
 # ---------------------------------------------------------------------------
 # Mock-based tests — patch models functions / managers
 # ---------------------------------------------------------------------------
 
 
+class TestDoltAddMocked:
+    """Test dolt_add with mocked models.dolt_add."""
+
+    @patch("django_dolt.models.dolt_add")
+    def test_add_defaults_to_all_tables(self, mock_add: MagicMock) -> None:
+        services.dolt_add()
+        mock_add.assert_called_once_with(".", using=None)
+
+    @patch("django_dolt.models.dolt_add")
+    def test_add_many_tables_in_one_call(self, mock_add: MagicMock) -> None:
+        services.dolt_add("a", "b", "c", using="mydb")
+        mock_add.assert_called_once_with("a", "b", "c", using="mydb")
+
+    @patch("django_dolt.models.dolt_add")
+    def test_add_table_keyword_still_supported(self, mock_add: MagicMock) -> None:
+        services.dolt_add(table="users", using="mydb")
+        mock_add.assert_called_once_with("users", using="mydb")
+
+    @patch("django_dolt.models.dolt_add")
+    def test_add_many_reports_failing_table(self, mock_add: MagicMock) -> None:
+        def fake_add(*tables: str, using: str | None = None) -> None:
+            if "bad" in tables:
+                raise Exception("table not found")
+
+        mock_add.side_effect = fake_add
+        with pytest.raises(services.DoltError, match="Failed to stage 'bad'"):
+            services.dolt_add("good", "bad")
+
+
+class TestDoltCommitMocked:
+    """Test commit error handling with mocked models.dolt_commit."""
+
+    @patch("django_dolt.models.dolt_commit")
+    def test_nothing_to_commit_returns_none(self, mock_commit: MagicMock) -> None:
+        mock_commit.side_effect = Exception("nothing to commit")
+        assert services.dolt_commit("msg") is None
+        assert services.dolt_add_and_commit("msg") is None
+
+    @patch("django_dolt.models.dolt_commit")
+    def test_other_failures_raise_commit_error(self, mock_commit: MagicMock) -> None:
+        mock_commit.side_effect = Exception("merge conflict")
+        with pytest.raises(services.DoltCommitError, match="merge conflict"):
+            services.dolt_commit("msg")
+        with pytest.raises(services.DoltCommitError, match="merge conflict"):
+            services.dolt_add_and_commit("msg")
+
+
+class TestIterDoltDiffMocked:
+    """Test iter_dolt_diff error handling."""
+
+    @patch("django_dolt.models.iter_dolt_diff")
+    def test_iter_diff_wraps_exception(self, mock_iter: MagicMock) -> None:
+        mock_iter.side_effect = Exception("table not found")
+        with pytest.raises(services.DoltError, match="table not found"):
+            next(services.iter_dolt_diff(table="missing"))
+
+
+class TestIterDoltLogMocked:
+    """Test iter_dolt_log error handling."""
+
+    @patch("django_dolt.models.CommitManager.iter_recent")
+    def test_iter_log_wraps_exception(self, mock_iter: MagicMock) -> None:
+        mock_iter.side_effect = Exception("connection lost")
+        with pytest.raises(services.DoltError, match="connection lost"):
+            next(services.iter_dolt_log())
+
+
+@pytest.fixture()
+def read_cache() -> Generator[None, None, None]:
+    """Enable the services read cache for one test."""
+    services.invalidate_caches()
+    with override_settings(DOLT_CACHE_TTL=60):
+        yield
+    services.invalidate_caches()
+
+
+class TestReadCache:
+    """Test caching of read helpers and invalidation on writes."""
+
+    @patch("django_dolt.models.Branch.objects.active_branch", return_value="main")
+    def test_disabled_by_default(self, mock_branch: MagicMock) -> None:
+        services.dolt_current_branch()
+        services.dolt_current_branch()
+        assert mock_branch.call_count == 2
+
+    @patch("django_dolt.models.dolt_pull", return_value=(1, 0))
+    @patch("django_dolt.models.Branch.objects.active_branch")
+    def test_pull_resolves_branch_uncached(
+        self, mock_branch: MagicMock, mock_pull: MagicMock, read_cache: None
+    ) -> None:
+        mock_branch.side_effect = ["main", "feature"]
+        services.dolt_current_branch()
+        services.dolt_pull(user="")
+        assert mock_pull.call_args[0][0] == ["origin", "feature"]
+
+    @patch("django_dolt.models.Branch.objects.active_branch", return_value="main")
+    def test_current_branch_cached_per_database(
+        self, mock_branch: MagicMock, read_cache: None
+    ) -> None:
+        services.dolt_current_branch(using="db1")
+        services.dolt_current_branch(using="db1")
+        services.dolt_current_branch(using="db2")
+        assert mock_branch.call_count == 2
+
+    @patch("django_dolt.models.BranchManager.names")
+    def test_cached_list_is_copied(
+        self, mock_names: MagicMock, read_cache: None
+    ) -> None:
+        mock_names.return_value = ["main"]
+        services.dolt_branch_list().append("mutated")
+        assert services.dolt_branch_list() == ["main"]
+        mock_names.assert_called_once()
+
+    @patch("django_dolt.models.IgnoreManager.patterns", return_value=[])
+    def test_ignore_patterns_not_cached(
+        self, mock_patterns: MagicMock, read_cache: None
+    ) -> None:
+        """Edits to dolt_ignore show up immediately in status filtering."""
+        services.get_ignored_tables()
+        services.get_ignored_tables()
+        assert mock_patterns.call_count == 2
+
+    @patch("django_dolt.models.dolt_add_remote")
+    @patch("django_dolt.models.RemoteManager.all_remotes")
+    def test_add_remote_invalidates(
+        self, mock_all: MagicMock, mock_add: MagicMock, read_cache: None
+    ) -> None:
+        mock_all.return_value = []
+        services.dolt_remotes(using="db1")
+        services.dolt_add_remote("origin", "https://example.com", using="db1")
+        services.dolt_remotes(using="db1")
+        assert mock_all.call_count == 2
+
+    @patch("django_dolt.models.CommitManager.recent", return_value=[])
+    def test_log_keyed_on_arguments(
+        self, mock_recent: MagicMock, read_cache: None
+    ) -> None:
+        services.dolt_log(limit=10)
+        services.dolt_log(limit=10)
+        services.dolt_log(limit=20)
+        assert mock_recent.call_count == 2
+
+    @patch("django_dolt.models.dolt_commit", return_value="abc123")
+    @patch("django_dolt.models.RemoteManager.all_remotes", return_value=[])
+    @patch("django_dolt.models.CommitManager.recent", return_value=[])
+    def test_commit_invalidates_dependent_reads_only(
+        self,
+        mock_recent: MagicMock,
+        mock_all: MagicMock,
+        mock_commit: MagicMock,
+        read_cache: None,
+    ) -> None:
+        services.dolt_log()
+        services.dolt_remotes()
+        services.dolt_commit("msg")
+        services.dolt_log()
+        services.dolt_remotes()
+        assert mock_recent.call_count == 2
+        mock_all.assert_called_once()
+
+    @patch("django_dolt.models.CommitManager.recent", return_value=[])
+    def test_least_recently_used_evicted(
+        self, mock_recent: MagicMock, read_cache: None
+    ) -> None:
+        with override_settings(DOLT_CACHE_SIZE=2):
+            services.dolt_log(limit=1)
+            services.dolt_log(limit=2)
+            services.dolt_log(limit=1)
+            services.dolt_log(limit=3)  # evicts limit=2
+            services.dolt_log(limit=1)
+            services.dolt_log(limit=2)
+        assert mock_recent.call_count == 4
+
+
 class TestDoltPushMocked:
     """Test dolt_push with mocked models.dolt_push."""
 
@@ -241,6 +447,74 @@ class TestDoltPushMocked:
         args = mock_push.call_args[0][0]
         assert "--force" in args
 
+    @patch("django_dolt.models.dolt_push")
+    def test_push_user_defaults_to_env(
+        self, mock_push: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("DOLT_REMOTE_USER", "alice")
+        services.dolt_push()
+        assert mock_push.call_args[0][0] == ["--user", "alice", "origin", "main"]
+
+    @patch("django_dolt.models.dolt_push")
+    def test_push_explicit_user_overrides_env(
+        self, mock_push: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("DOLT_REMOTE_USER", "alice")
+        services.dolt_push(user="")
+        assert mock_push.call_args[0][0] == ["origin", "main"]
+
+
+class TestAsyncNetworkOpsMocked:
+    """Test the async push/pull/fetch wrappers with mocked models."""
+
+    @patch("django_dolt.models.dolt_push")
+    def test_push_async(self, mock_push: MagicMock) -> None:
+        result = asyncio.run(
+            services.dolt_push_async("origin", "dev", user="", using="db1")
+        )
+        assert result == "Pushed dev to origin"
+        mock_push.assert_called_once_with(["origin", "dev"], using="db1")
+
+    @patch("django_dolt.models.dolt_push")
+    def test_push_async_error_propagates(self, mock_push: MagicMock) -> None:
+        mock_push.side_effect = Exception("push denied")
+        with pytest.raises(services.DoltPushError, match="push denied"):
+            asyncio.run(services.dolt_push_async(user=""))
+
+    @patch("django_dolt.models.dolt_fetch")
+    def test_fetch_async(self, mock_fetch: MagicMock) -> None:
+        result = asyncio.run(services.dolt_fetch_async("upstream", user=""))
+        assert result == "Fetched from upstream"
+        mock_fetch.assert_called_once_with(["upstream"], using=None)
+
+
+class TestDoltPushManyMocked:
+    """Test dolt_push_many with mocked models.dolt_push."""
+
+    @patch("django_dolt.models.dolt_push")
+    def test_pushes_each_database(self, mock_push: MagicMock) -> None:
+        results = services.dolt_push_many(["db1", "db2"], branch="main")
+
+        assert results == [
+            ("db1", True, "Pushed main to origin"),
+            ("db2", True, "Pushed main to origin"),
+        ]
+        pushed = sorted(c.kwargs["using"] for c in mock_push.call_args_list)
+        assert pushed == ["db1", "db2"]
+
+    @patch("django_dolt.models.dolt_push")
+    def test_failure_does_not_stop_others(self, mock_push: MagicMock) -> None:
+        def fake_push(args: list[str], *, using: str | None = None) -> None:
+            if using == "db1":
+                raise Exception("push denied")
+
+        mock_push.side_effect = fake_push
+        results = services.dolt_push_many(["db1", "db2"])
+
+        assert results[0][:2] == ("db1", False)
+        assert "push denied" in results[0][2]
+        assert results[1][:2] == ("db2", True)
+
 
 class TestDoltFetchMocked:
     """Test dolt_fetch with mocked models.dolt_fetch."""
@@ -314,12 +588,13 @@ class TestDoltStatusErrorHandling:
         with pytest.raises(services.DoltError, match="connection lost"):
             services.dolt_status(exclude_ignored=False)
 
-    @patch("django_dolt.models.Status.objects.current")
+    @patch("django_dolt.models.IgnoreManager.patterns")
+    @patch("django_dolt.models.Status.objects.current", return_value=[])
     def test_status_exclude_ignored_error_propagates(
-        self, mock_current: MagicMock
+        self, mock_current: MagicMock, mock_patterns: MagicMock
     ) -> None:
         """When dolt_ignore query fails, error propagates."""
-        mock_current.side_effect = Exception(
+        mock_patterns.side_effect = Exception(
             "table dolt_ignore doesn't exist"
         )
 
@@ -328,6 +603,33 @@ class TestDoltStatusErrorHandling:
         ):
             services.dolt_status(exclude_ignored=True)
 
+    @patch("django_dolt.models.IgnoreManager.patterns", return_value=["django_%"])
+    @patch("django_dolt.models.Status.objects.current")
+    def test_status_filters_ignored_tables(
+        self, mock_current: MagicMock, mock_patterns: MagicMock
+    ) -> None:
+        mock_current.return_value = [
+            {"table_name": "django_session", "staged": False, "status": "modified"},
+            {"table_name": "inventory", "staged": False, "status": "modified"},
+        ]
+
+        result = services.dolt_status(exclude_ignored=True)
+
+        assert [row["table_name"] for row in result] == ["inventory"]
+        mock_current.assert_called_once_with(exclude_ignored=False, using=None)
+
+    @patch("django_dolt.models.IgnoreManager.patterns")
+    @patch("django_dolt.models.Status.objects.current")
+    def test_status_uses_given_patterns(
+        self, mock_current: MagicMock, mock_patterns: MagicMock
+    ) -> None:
+        mock_current.return_value = [
+            {"table_name": "django_session", "staged": False, "status": "modified"},
+        ]
+
+        assert services.dolt_status(patterns=["django_%"]) == []
+        mock_patterns.assert_not_called()
+
 
 class TestDoltPullMocked:
     """Test dolt_pull with mocked models.dolt_pull."""
@@ -25,9 +25,14 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
+        # Create tables straight from the models instead of replaying
+        # every contrib migration for each test run
+        "TEST": {"MIGRATE": False},
     },
     "dolt": {
         "ENGINE": "django.db.backends.mysql",
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
         "HOST": os.environ.get("DOLT_HOST", "127.0.0.1"),
         "PORT": int(os.environ.get("DOLT_PORT", "8906")),
         "USER": os.environ.get("DOLT_USER", "root"),
@@ -37,6 +42,8 @@ DATABASES = {
     },
     "dolt1": {
         "ENGINE": "django.db.backends.mysql",
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
         "HOST": os.environ.get("DOLT_HOST", "127.0.0.1"),
         "PORT": int(os.environ.get("DOLT_PORT", "8906")),
         "USER": os.environ.get("DOLT_USER", "root"),
@@ -46,6 +53,8 @@ DATABASES = {
     },
     "dolt2": {
         "ENGINE": "django.db.backends.mysql",
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
         "HOST": os.environ.get("DOLT_HOST", "127.0.0.1"),
         "PORT": int(os.environ.get("DOLT_PORT", "8906")),
         "USER": os.environ.get("DOLT_USER", "root"),